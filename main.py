@@ -4,7 +4,7 @@ from src.interfaces.qualifying import run_qualifying_replay
 import sys
 from src.cli.race_selection import cli_load
 from src.gui.race_selection import RaceSelectionWindow
-from PySide6.QtWidgets import QApplication
+from src.gui.qt_app import get_or_create_qapp
 
 def main(year=None, round_number=None, playback_speed=1, session_type='R', visible_hud=True, ready_file=None, show_telemetry_viewer=True):
   print(f"Loading F1 {year} Round {round_number} Session '{session_type}'")
@@ -154,7 +154,7 @@ if __name__ == "__main__":
 
   # Run the GUI
 
-  app = QApplication(sys.argv)
+  app = get_or_create_qapp()
   win = RaceSelectionWindow()
   win.show()
   sys.exit(app.exec())
\ No newline at end of file
@@ -1,10 +1,136 @@
 import sys
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QFrame, QScrollArea
+    QPushButton, QLabel, QFrame, QListView, QStyledItemDelegate,
+    QStyle, QStyleOptionButton
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, Slot
+from PySide6.QtGui import QFont, QFontMetrics, QPalette
+from src.gui.qt_app import get_or_create_qapp
+
+# Shared fonts for the painted insight rows, built once instead of per row
+_FONT_HEADING = QFont("Arial", 12, QFont.Bold)
+_FONT_SMALL = QFont("Arial", 10)
+
+# Header/footer label fonts, resolved once by the stylesheet on the central widget
+_MENU_STYLESHEET = """
+    QLabel#title { font: bold 24pt "Arial"; }
+    QLabel#subtitle { font: 11pt "Arial"; }
+    QLabel#info { font: 10pt "Arial"; }
+"""
+
+
+class InsightListModel(QAbstractListModel):
+    """
+    Flat list model backing the menu: each category contributes a header
+    row followed by one row per insight (name, description, callback).
+    """
+
+    DescriptionRole = Qt.UserRole + 1
+    IsCategoryRole = Qt.UserRole + 2
+    CallbackRole = Qt.UserRole + 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (is_category, name, description, callback)
+        self._rows = []
+
+    def add_category(self, category_name, insights):
+        """Append a category header followed by its `(name, description, callback)` insights."""
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(insights))
+        self._rows.append((True, category_name.upper(), "", None))
+        for name, description, callback in insights:
+            self._rows.append((False, name, description, callback))
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        is_category, name, description, callback = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == self.DescriptionRole:
+            return description
+        if role == self.IsCategoryRole:
+            return is_category
+        if role == self.CallbackRole:
+            return callback
+        return None
+
+    def flags(self, index):
+        if index.isValid() and self._rows[index.row()][0]:
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class InsightItemDelegate(QStyledItemDelegate):
+    """
+    Paints category headers and insight "buttons" (bold name over a smaller
+    description) directly, so rows need no per-item widgets or layouts.
+    """
+
+    CATEGORY_HEIGHT = 36
+    INSIGHT_HEIGHT = 54
+    PADDING = 8
+
+    CATEGORY_FONT = _FONT_HEADING
+    NAME_FONT = _FONT_HEADING
+    DESC_FONT = _FONT_SMALL
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._desc_metrics = QFontMetrics(self.DESC_FONT)
+
+    def sizeHint(self, option, index):
+        # Width is left to the view, which stretches rows across the viewport
+        if index.data(InsightListModel.IsCategoryRole):
+            return QSize(0, self.CATEGORY_HEIGHT)
+        return QSize(0, self.INSIGHT_HEIGHT)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        if index.data(InsightListModel.IsCategoryRole):
+            self._paint_category(painter, option, index)
+        else:
+            self._paint_insight(painter, option, index)
+        painter.restore()
+
+    def _paint_category(self, painter, option, index):
+        rect = option.rect
+        painter.setFont(self.CATEGORY_FONT)
+        painter.setPen(option.palette.color(QPalette.WindowText))
+        text_rect = rect.adjusted(2, 0, -2, -4)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignBottom, index.data(Qt.DisplayRole))
+        # Separator line under the category label
+        painter.setPen(option.palette.color(QPalette.Mid))
+        painter.drawLine(rect.left(), rect.bottom(), rect.right(), rect.bottom())
+
+    def _paint_insight(self, painter, option, index):
+        # Reuse the style's push-button bevel so rows look like the old buttons
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(0, 2, 0, -2)
+        button.palette = option.palette
+        button.state = QStyle.State_Enabled | QStyle.State_Raised
+        if option.state & QStyle.State_MouseOver:
+            button.state |= QStyle.State_MouseOver
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButtonBevel, button, painter, option.widget)
+
+        inner = button.rect.adjusted(self.PADDING, 4, -self.PADDING, -4)
+        half = inner.height() // 2
+        painter.setPen(option.palette.color(QPalette.ButtonText))
+        painter.setFont(self.NAME_FONT)
+        painter.drawText(QRect(inner.left(), inner.top(), inner.width(), half),
+                         Qt.AlignLeft | Qt.AlignVCenter, index.data(Qt.DisplayRole))
+        painter.setFont(self.DESC_FONT)
+        description = self._desc_metrics.elidedText(
+            index.data(InsightListModel.DescriptionRole), Qt.ElideRight, inner.width())
+        painter.drawText(QRect(inner.left(), inner.top() + half, inner.width(), inner.height() - half),
+                         Qt.AlignLeft | Qt.AlignVCenter, description)
 
 
 class InsightsMenu(QMainWindow):
@@ -22,6 +148,7 @@ class InsightsMenu(QMainWindow):
     def setup_ui(self):
         # Central widget
         central_widget = QWidget()
+        central_widget.setStyleSheet(_MENU_STYLESHEET)
         self.setCentralWidget(central_widget)
         
         # Main layout
@@ -33,37 +160,28 @@ class InsightsMenu(QMainWindow):
         header = self.create_header()
         main_layout.addWidget(header)
         
-        # Scrollable content area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setSpacing(2)
-        content_layout.setContentsMargins(10, 10, 10, 10)
+        # Insight list: a model + painted delegate, so only visible rows are drawn
+        self.insight_model = InsightListModel(self)
         
         # Add insight categories
 
-        content_layout.addWidget(self.create_category_section(
+        self.insight_model.add_category(
             "Example Insights",
             [
                 ("Example Insight Window", "Launch an example insight window", self.launch_example_window),
             ]
-        ))
+        )
 
-        content_layout.addWidget(self.create_category_section(
+        self.insight_model.add_category(
             "Live Telemetry",
             [
                 ("Telemetry Stream Viewer", "View raw telemetry data", self.launch_telemetry_viewer),
                 ("Driver Live Telemetry", "Speed, gear, throttle & braking for a selected driver", self.launch_driver_telemetry),
             ]
-        ))
-        
-        content_layout.addStretch()
+        )
         
-        scroll.setWidget(content_widget)
-        main_layout.addWidget(scroll)
+        self.insight_list = self.create_insight_list()
+        main_layout.addWidget(self.insight_list)
         
         # Footer
         footer = self.create_footer()
@@ -76,11 +194,11 @@ class InsightsMenu(QMainWindow):
         layout = QVBoxLayout(header)
         
         title = QLabel("🏎️ F1 Insights")
-        title.setFont(QFont("Arial", 24, QFont.Bold))
+        title.setObjectName("title")
         layout.addWidget(title)
         
         subtitle = QLabel("Launch telemetry insights and analysis tools")
-        subtitle.setFont(QFont("Arial", 11))
+        subtitle.setObjectName("subtitle")
         layout.addWidget(subtitle)
         
         return header
@@ -92,7 +210,7 @@ class InsightsMenu(QMainWindow):
         layout = QHBoxLayout(footer)
         
         info_label = QLabel("Requires telemetry stream enabled")
-        info_label.setFont(QFont("Arial", 10))
+        info_label.setObjectName("info")
         layout.addWidget(info_label)
         
         layout.addStretch()
@@ -104,55 +222,30 @@ class InsightsMenu(QMainWindow):
         
         return footer
     
-    def create_category_section(self, category_name, insights):
-        section = QFrame()
-        section.setFrameShape(QFrame.NoFrame)
-        
-        layout = QVBoxLayout(section)
-        layout.setSpacing(4)
-        
-        # Category label
-        category_label = QLabel(category_name.upper())
-        category_label.setFont(QFont("Arial", 12, QFont.Bold))
-        layout.addWidget(category_label)
-        
-        # Separator line
-        separator = QFrame()
-        separator.setFrameShape(QFrame.HLine)
-        layout.addWidget(separator)
-        
-        # Add insight buttons
-        for name, description, callback in insights:
-            btn = self.create_insight_button(name, description, callback)
-            layout.addWidget(btn)
-        
-        return section
+    def create_insight_list(self):
+        view = QListView()
+        view.setModel(self.insight_model)
+        view.setItemDelegate(InsightItemDelegate(view))
+        view.setFrameShape(QFrame.NoFrame)
+        view.setSelectionMode(QListView.NoSelection)
+        view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        view.setViewportMargins(10, 10, 10, 10)
+        view.setSpacing(1)
+        # Blend into the window and track the mouse for hover highlighting
+        view.viewport().setBackgroundRole(QPalette.Window)
+        view.viewport().setCursor(Qt.PointingHandCursor)
+        view.setMouseTracking(True)
+        
+        view.clicked.connect(self._on_insight_clicked)
+        
+        return view
     
-    def create_insight_button(self, name, description, callback):
-        button = QPushButton()
-        button.setCursor(Qt.PointingHandCursor)
-        
-        # Create button layout with name and description
-        btn_layout = QVBoxLayout()
-        btn_layout.setSpacing(2)
-        btn_layout.setContentsMargins(4, 4, 4, 4)
-        
-        name_label = QLabel(name)
-        name_label.setFont(QFont("Arial", 12, QFont.Bold))
-        
-        desc_label = QLabel(description)
-        desc_label.setFont(QFont("Arial", 10))
-        
-        btn_layout.addWidget(name_label)
-        btn_layout.addWidget(desc_label)
-        
-        button.setLayout(btn_layout)
-        button.setMinimumHeight(50)
-        
-        # Connect callback
-        button.clicked.connect(callback)
-        
-        return button
+    @Slot(QModelIndex)
+    def _on_insight_clicked(self, index):
+        callback = index.data(InsightListModel.CallbackRole)
+        if callback is not None:
+            callback()
     
     # Insight launch methods (placeholders for now)
     
@@ -174,10 +267,12 @@ class InsightsMenu(QMainWindow):
 
     def launch_telemetry_viewer(self):
         print("🚀 Launching: Telemetry Stream Viewer")
+        # Host the viewer in this process rather than spawning a new interpreter
         try:
-            import subprocess
-            import sys
-            subprocess.Popen([sys.executable, "-m", "src.insights.telemetry_stream_viewer"])
+            from src.insights.telemetry_stream_viewer import TelemetryStreamViewer
+            window = TelemetryStreamViewer()
+            window.show()
+            self.opened_windows.append(window)
         except Exception as e:
             print(f"Failed to launch telemetry viewer: {e}")
             self.show_placeholder_message("Telemetry Stream Viewer")
@@ -243,10 +338,7 @@ class InsightsMenu(QMainWindow):
 
 
 def launch_insights_menu():
-    # Check if QApplication instance already exists
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
+    get_or_create_qapp()
     
     menu = InsightsMenu()
     menu.show()
@@ -255,8 +347,7 @@ def launch_insights_menu():
 
 
 def main():
-    app = QApplication(sys.argv)
-    app.setApplicationName("F1 Insights Menu")
+    app = get_or_create_qapp("F1 Insights Menu")
     
     menu = InsightsMenu()
     menu.show()
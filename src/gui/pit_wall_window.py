@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import QMainWindow, QStatusBar, QLabel
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from src.services.stream import TelemetryStreamClient
 
 
@@ -39,6 +39,7 @@ class PitWallWindow(QMainWindow):
         self.messages_label = QLabel("Messages: 0")
         self.status_bar.addPermanentWidget(self.messages_label)
     
+    @Slot(dict)
     def _handle_data_received(self, data):
         """Internal handler for received telemetry data."""
         self.message_count += 1
@@ -47,6 +48,7 @@ class PitWallWindow(QMainWindow):
         # Call subclass implementation
         self.on_telemetry_data(data)
     
+    @Slot(str)
     def _handle_connection_status(self, status):
         """Internal handler for connection status changes."""
         self.connection_label.setText(f"Status: {status}")
@@ -61,6 +63,7 @@ class PitWallWindow(QMainWindow):
         # Notify subclass
         self.on_connection_status_changed(status)
     
+    @Slot(str)
     def _handle_error(self, error_msg):
         """Internal handler for stream errors."""
         self.status_bar.showMessage(f"Error: {error_msg}", 5000)
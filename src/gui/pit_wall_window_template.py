@@ -5,8 +5,8 @@ Copy this file and replace the placeholder comments with your own implementation
 """
 
 import sys
-from PySide6.QtWidgets import QApplication
 from src.gui.pit_wall_window import PitWallWindow
+from src.gui.qt_app import get_or_create_qapp
 
 
 class MyCustomWindow(PitWallWindow):
@@ -71,7 +71,7 @@ class MyCustomWindow(PitWallWindow):
 
 def main():
     """Launch the custom window."""
-    app = QApplication(sys.argv)
+    app = get_or_create_qapp()
     window = MyCustomWindow()
     window.show()
     sys.exit(app.exec())
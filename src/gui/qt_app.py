@@ -0,0 +1,19 @@
+import sys
+from PySide6.QtWidgets import QApplication
+
+
+def get_or_create_qapp(application_name=None):
+    """
+    Return the process-wide QApplication, creating it from sys.argv on first use.
+
+    Entry points call this instead of constructing QApplication directly, so
+    a window started inside an already-running app (e.g. launched from the
+    insights menu) reuses it. The application name is only applied when the
+    app is created here, so a host application keeps its own.
+    """
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+        if application_name:
+            app.setApplicationName(application_name)
+    return app
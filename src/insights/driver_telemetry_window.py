@@ -1,21 +1,36 @@
 import sys
+from bisect import bisect_left
 from collections import deque
+from operator import itemgetter
 
+import numpy as np
 import matplotlib
 matplotlib.use("QtAgg")
-import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
 import matplotlib.ticker as ticker
+from matplotlib.collections import LineCollection
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout,
+    QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox
 )
+from PySide6.QtCore import QTimer, Slot
 from PySide6.QtGui import QFont
 from src.gui.pit_wall_window import PitWallWindow
+from src.gui.qt_app import get_or_create_qapp
 
 _TIME_WINDOW = 30        # seconds kept in rolling-time mode
+_MAX_SAMPLE_RATE = 60    # Hz; upper bound of the stream's frame rate
+# Room for two full windows: the buffer never has to grow, and the live
+# window only slides back to the front once per _TIME_WINDOW of samples.
+_TIME_BUFFER_CAPACITY = 2 * _TIME_WINDOW * _MAX_SAMPLE_RATE
+_LAP_SECONDS = 120       # a racing lap fits without growing; slower laps still can
+_LAP_BUFFER_CAPACITY = _LAP_SECONDS * _MAX_SAMPLE_RATE
+_REDRAW_INTERVAL_MS = 33 # chart refresh cadence (~30 Hz), independent of stream rate
+_MAX_PENDING_FRAMES = 256 # frames queued between ticks before they are ingested early
 
 # Colours matching the qualifying viewer
 _BG        = "#282828"   # panel background
@@ -24,6 +39,107 @@ _GEAR_COL  = "#B0B0B0"   # light gray
 _THROT_COL = "#2ECC71"   # green
 _BRAKE_COL = "#E74C3C"   # red
 
+# Per-sample columns for each buffer, in append() order. Session time stays
+# float64 so long sessions keep sub-millisecond resolution; everything else
+# comfortably fits in float32 (or int8 for the gear).
+_TIME_DTYPES = {
+    "t":        np.float64,
+    "speed":    np.float32,
+    "gear":     np.int8,
+    "throttle": np.float32,
+    "brake":    np.float32,
+}
+_LAP_DTYPES = {
+    "dist":     np.float32,
+    "speed":    np.float32,
+    "gear":     np.int8,
+    "throttle": np.float32,
+    "brake":    np.float32,
+}
+
+# Driver fields read for every sample, in _unpack_driver() order
+_DRIVER_KEYS = ("speed", "gear", "throttle", "brake", "dist", "lap")
+_get_driver_fields = itemgetter(*_DRIVER_KEYS)
+
+
+def _unpack_driver(driver: dict) -> tuple:
+    """
+    Return (speed, gear, throttle, brake, dist, lap) for one driver entry.
+    Missing or null numeric fields read as 0; `lap` is passed through as-is.
+    Values are not coerced here – the typed sample buffers convert on write.
+    """
+    try:
+        speed, gear, throttle, brake, dist, lap = _get_driver_fields(driver)
+    except KeyError:
+        speed, gear, throttle, brake, dist, lap = map(driver.get, _DRIVER_KEYS)
+    return speed or 0, gear or 0, throttle or 0, brake or 0, dist or 0, lap
+
+
+class _SampleBuffer:
+    """
+    Structure-of-arrays sample store. Live samples occupy the contiguous
+    slice [start:end] of every column, so each column can be handed to
+    matplotlib as an ndarray view without any per-sample Python iteration.
+    """
+
+    def __init__(self, dtypes: dict, capacity: int = 1024):
+        self._columns = {name: i for i, name in enumerate(dtypes)}
+        self._arrays = [np.empty(capacity, dtype=dtype) for dtype in dtypes.values()]
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def append(self, *values):
+        """Write one sample; `values` follow the column order of `dtypes`."""
+        if self._end == len(self._arrays[0]):
+            self._make_room()
+        end = self._end
+        for arr, value in zip(self._arrays, values):
+            arr[end] = value
+        self._end = end + 1
+
+    def drop_before(self, column: str, cutoff: float):
+        """Discard leading samples whose (ascending) `column` is below `cutoff`."""
+        live = self.view(column)
+        self._start += int(np.searchsorted(live, cutoff, side="left"))
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+
+    def view(self, column: str) -> np.ndarray:
+        return self._arrays[self._columns[column]][self._start:self._end]
+
+    def last(self, column: str) -> float:
+        return float(self._arrays[self._columns[column]][self._end - 1])
+
+    def _make_room(self):
+        # Slide the live window back to index 0; grow only if it is still full.
+        count = len(self)
+        capacity = len(self._arrays[0])
+        if count > capacity // 2:
+            capacity *= 2
+        for i, arr in enumerate(self._arrays):
+            if capacity != len(arr):
+                grown = np.empty(capacity, dtype=arr.dtype)
+                grown[:count] = arr[self._start:self._end]
+                self._arrays[i] = grown
+            else:
+                arr[:count] = arr[self._start:self._end]
+        self._start = 0
+        self._end = count
+
+
+class _LapBuffer(_SampleBuffer):
+    """Samples for a driver's current lap, keyed on distance into the lap."""
+
+    def __init__(self):
+        super().__init__(_LAP_DTYPES, capacity=_LAP_BUFFER_CAPACITY)
+        self.lap = None
+        self.start_dist = 0.0
+
 
 class DriverTelemetryWindow(PitWallWindow):
     """
@@ -33,16 +149,32 @@ class DriverTelemetryWindow(PitWallWindow):
     """
 
     def __init__(self):
-        self._known_drivers = []
-        # time mode: deque of {"t", "speed", "gear", "throttle", "brake"}
-        self._time_buffers: dict[str, deque] = {}
-        # lap mode: {"lap", "start_dist", "samples": list of {"dist", ...}}
-        self._lap_buffers: dict[str, dict] = {}
+        # driver codes currently listed in the combobox, as a set and in list order
+        self._known_drivers: set[str] = set()
+        self._driver_order: list[str] = []
+        # mirror of driver_combo.currentText(), kept off the per-frame Qt path
+        self._selected_code = ""
+        # time mode: rolling _TIME_WINDOW of samples, ascending "t"
+        self._time_buffers: dict[str, _SampleBuffer] = {}
+        # lap mode: samples since the start of the current lap
+        self._lap_buffers: dict[str, _LapBuffer] = {}
+        # (lap, absolute dist at lap start) for every driver, not just the
+        # buffered one, so a newly selected driver's lap lines up at once
+        self._lap_starts: dict[str, tuple] = {}
         # length of the most recently completed lap per driver (metres)
         self._lap_lengths: dict[str, float] = {}
         # circuit length from the session (metres), received via stream
         self._circuit_length_m: float | None = None
         self._x_mode = "time"   # "time" | "lap"
+        # blitting state: per-axes backgrounds captured on every full draw
+        self._backgrounds = None
+        self._blit_bbox = None
+        self._xlim = None
+        self._full_draw_pending = True
+        # frames received since the last timer tick, ingested on the next one
+        self._pending_frames: deque = deque()
+        # set when new samples arrive; consumed by the redraw timer
+        self._dirty = False
         super().__init__()
         self.setWindowTitle("F1 Race Replay - Driver Live Telemetry")
 
@@ -82,8 +214,11 @@ class DriverTelemetryWindow(PitWallWindow):
         control_row.addStretch()
         root_layout.addLayout(control_row)
 
-        # Matplotlib figure – three stacked panels, same proportions as qualifying viewer
-        self._fig = plt.figure(figsize=(10, 6), facecolor=_BG)
+        # Matplotlib figure – three stacked panels, same proportions as qualifying viewer.
+        # Built directly rather than via pyplot, so no extra FigureManager window
+        # and canvas are created and the figure isn't kept alive by pyplot's registry.
+        # No layout engine: full redraws shouldn't re-run a layout pass.
+        self._fig = Figure(figsize=(10, 6), facecolor=_BG, layout="none")
         gs = gridspec.GridSpec(
             3, 1,
             figure=self._fig,
@@ -93,7 +228,7 @@ class DriverTelemetryWindow(PitWallWindow):
 
         # Speed panel
         self._ax_speed = self._fig.add_subplot(gs[0])
-        self._line_speed, = self._ax_speed.plot([], [], color=_SPEED_COL, linewidth=1.5)
+        self._line_speed, = self._ax_speed.plot([], [], color=_SPEED_COL, linewidth=1.5, animated=True)
         self._ax_speed.set_facecolor(_BG)
         self._ax_speed.set_ylabel("Speed (km/h)", color=_SPEED_COL, fontsize=10)
         self._ax_speed.set_ylim(0, 380)
@@ -103,7 +238,7 @@ class DriverTelemetryWindow(PitWallWindow):
 
         # Gear panel
         self._ax_gear = self._fig.add_subplot(gs[1])
-        self._line_gear, = self._ax_gear.plot([], [], color=_GEAR_COL, linewidth=1.5, drawstyle="steps-post")
+        self._line_gear, = self._ax_gear.plot([], [], color=_GEAR_COL, linewidth=1.5, drawstyle="steps-post", animated=True)
         self._ax_gear.set_facecolor(_BG)
         self._ax_gear.set_ylabel("Gear", color=_GEAR_COL, fontsize=10)
         self._ax_gear.set_ylim(0, 9)
@@ -114,8 +249,9 @@ class DriverTelemetryWindow(PitWallWindow):
 
         # Throttle / Brake panel
         self._ax_ctrl = self._fig.add_subplot(gs[2])
-        self._line_throt, = self._ax_ctrl.plot([], [], color=_THROT_COL, linewidth=1.5)
-        self._line_brake, = self._ax_ctrl.plot([], [], color=_BRAKE_COL, linewidth=1.5)
+        # Throttle and brake share one collection (segment 0 / 1), drawn in a single call
+        self._ctrl_lines = LineCollection([], colors=[_THROT_COL, _BRAKE_COL], linewidths=1.5, animated=True)
+        self._ax_ctrl.add_collection(self._ctrl_lines, autolim=False)
         self._ax_ctrl.set_facecolor(_BG)
         self._ax_ctrl.set_ylabel("Throttle / Brake (%)", color=_SPEED_COL, fontsize=10)
         self._ax_ctrl.set_ylim(-5, 105)
@@ -127,16 +263,34 @@ class DriverTelemetryWindow(PitWallWindow):
         self._ax_ctrl.set_xlabel("Time (s)", color=_SPEED_COL, fontsize=9)
 
         self._canvas = FigureCanvas(self._fig)
+        self._canvas.mpl_connect("draw_event", self._on_draw)
         root_layout.addWidget(self._canvas)
 
+        # Lines are animated: full draws only render the static artwork, and
+        # each update blits the lines over the cached per-axes backgrounds.
+        self._panels = (
+            (self._ax_speed, (self._line_speed,)),
+            (self._ax_gear,  (self._line_gear,)),
+            (self._ax_ctrl,  (self._ctrl_lines,)),
+        )
+
         self._apply_xmode_labels()
 
+        # Packets are only queued as they arrive; each tick ingests the queue
+        # and repaints once, so GUI work follows the display cadence rather
+        # than the stream rate.
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setInterval(_REDRAW_INTERVAL_MS)
+        self._redraw_timer.timeout.connect(self._redraw_if_dirty)
+        self._redraw_timer.start()
+
     # ── X-axis mode helpers ───────────────────────────────────────────────
 
+    @Slot(int)
     def _on_xmode_changed(self, index: int):
         self._x_mode = "time" if index == 0 else "lap"
         self._apply_xmode_labels()
-        self._redraw(self.driver_combo.currentText())
+        self._redraw(self._selected_code)
 
     def _apply_xmode_labels(self):
         if self._x_mode == "time":
@@ -145,68 +299,100 @@ class DriverTelemetryWindow(PitWallWindow):
         else:
             self._ax_ctrl.set_xlabel("Distance (m)", color=_SPEED_COL, fontsize=9)
             self._ax_ctrl.xaxis.set_major_formatter(ticker.FormatStrFormatter("%.0f"))
+        self._full_draw_pending = True
 
     # ── Buffer management ─────────────────────────────────────────────────
 
     def _ensure_buffers(self, code: str):
         if code not in self._time_buffers:
-            self._time_buffers[code] = deque()
+            self._time_buffers[code] = _SampleBuffer(_TIME_DTYPES, _TIME_BUFFER_CAPACITY)
         if code not in self._lap_buffers:
-            self._lap_buffers[code] = {"lap": None, "start_dist": 0.0, "samples": []}
+            self._lap_buffers[code] = _LapBuffer()
 
     def _append_sample(self, code: str, driver: dict, session_t: float):
         self._ensure_buffers(code)
 
-        speed    = float(driver.get("speed")    or 0)
-        gear     = int(driver.get("gear")       or 0)
-        throttle = float(driver.get("throttle") or 0)
-        brake    = float(driver.get("brake")    or 0) * 100 # Convert to percentage as brake is 0-1 in the stream but we want 0-100 on the chart
-        dist     = float(driver.get("dist")     or 0)
-        lap      = driver.get("lap")
+        # brake is 0-1 in the stream; scaled to % at draw time
+        speed, gear, throttle, brake, dist, lap = _unpack_driver(driver)
 
         # ── time buffer: prune samples older than _TIME_WINDOW ──
         tb = self._time_buffers[code]
-        tb.append({"t": session_t, "speed": speed, "gear": gear,
-                   "throttle": throttle, "brake": brake})
-        cutoff = session_t - _TIME_WINDOW
-        while tb and tb[0]["t"] < cutoff:
-            tb.popleft()
+        if tb and session_t < tb.last("t"):
+            tb.clear()  # playback jumped backwards; keep "t" ascending
+        tb.append(session_t, speed, gear, throttle, brake)
+        tb.drop_before("t", session_t - _TIME_WINDOW)
 
         # ── lap buffer: reset on new lap ──
         lb = self._lap_buffers[code]
-        if lap is not None and lap != lb["lap"]:
-            # Record the completed lap's total distance before resetting
-            if lb["samples"]:
-                self._lap_lengths[code] = lb["samples"][-1]["dist"]
-            lb["lap"] = lap
-            lb["start_dist"] = dist
-            lb["samples"] = []
-        lap_dist = dist - lb["start_dist"]
-        lb["samples"].append({"dist": lap_dist, "speed": speed, "gear": gear,
-                               "throttle": throttle, "brake": brake})
+        if lap is not None and lap != lb.lap:
+            # Measure from where the lap actually started, which predates the
+            # buffer when the driver was only just selected
+            lb.lap, lb.start_dist = self._lap_starts.get(code, (lap, dist))
+            lb.clear()
+        lb.append(dist - lb.start_dist, speed, gear, throttle, brake)
+        self._dirty = True
+
+    def _track_lap_starts(self, drivers: dict):
+        lap_starts = self._lap_starts
+        for code, driver in drivers.items():
+            lap = driver.get("lap")
+            if lap is None:
+                continue
+            start = lap_starts.get(code)
+            if start is None or start[0] != lap:
+                dist = driver.get("dist") or 0
+                # Record the completed lap's distance only on a plain lap
+                # change; a seek backwards or across several laps just reseeds
+                if start is not None and lap == start[0] + 1 and dist > start[1]:
+                    self._lap_lengths[code] = dist - start[1]
+                lap_starts[code] = (lap, dist)
 
     # ── Driver selector ───────────────────────────────────────────────────
 
+    @Slot(str)
     def _on_driver_selected(self, driver_code: str):
+        self._selected_code = driver_code
+        # Only the selected driver's samples are buffered, so anything held for
+        # the previous selection is stale; lap starts are tracked for everyone.
+        for buffers in (self._time_buffers, self._lap_buffers):
+            for code in [c for c in buffers if c != driver_code]:
+                del buffers[code]
         self._redraw(driver_code)
 
     def _refresh_driver_list(self, drivers: dict):
-        incoming = sorted(drivers.keys())
-        if incoming == self._known_drivers:
+        # Set comparison first: the grid rarely changes, so only sort on a diff
+        if drivers.keys() == self._known_drivers:
             return
-        current = self.driver_combo.currentText()
-        self.driver_combo.blockSignals(True)
-        self.driver_combo.clear()
-        self.driver_combo.addItems(incoming)
-        if current in incoming:
-            self.driver_combo.setCurrentText(current)
-        elif incoming:
-            self.driver_combo.setCurrentIndex(0)
-        self.driver_combo.blockSignals(False)
+        incoming = set(drivers)
+        combo = self.driver_combo
+        order = self._driver_order
+        combo.blockSignals(True)
+        # Patch the combobox in place (sorted) rather than clear() + addItems()
+        for code in self._known_drivers - incoming:
+            row = order.index(code)
+            del order[row]
+            combo.removeItem(row)
+        for code in sorted(incoming - self._known_drivers):
+            row = bisect_left(order, code)
+            order.insert(row, code)
+            combo.insertItem(row, code)
+        if self._selected_code not in incoming and order:
+            combo.setCurrentIndex(0)
+        combo.blockSignals(False)
         self._known_drivers = incoming
+        # Signals were blocked, so sync the cached selection by hand
+        self._selected_code = self.driver_combo.currentText()
 
     # ── Chart redraw ──────────────────────────────────────────────────────
 
+    @Slot()
+    def _redraw_if_dirty(self):
+        self._ingest_pending()
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._redraw(self._selected_code)
+
     def _redraw(self, driver_code: str):
         if not driver_code:
             self._clear_lines()
@@ -217,7 +403,7 @@ class DriverTelemetryWindow(PitWallWindow):
         else:
             self._redraw_lap(driver_code)
 
-        self._canvas.draw_idle()
+        self._update_canvas()
 
     def _redraw_time(self, code: str):
         tb = self._time_buffers.get(code)
@@ -225,35 +411,24 @@ class DriverTelemetryWindow(PitWallWindow):
             self._clear_lines()
             return
 
-        samples = list(tb)
-        t_now = samples[-1]["t"]
-        xs        = [s["t"] - t_now for s in samples]   # 0 = now, -30 = 30s ago
-        speeds    = [s["speed"]    for s in samples]
-        gears     = [s["gear"]     for s in samples]
-        throttles = [s["throttle"] for s in samples]
-        brakes    = [s["brake"]    for s in samples]
+        ts = tb.view("t")
+        xs = ts - ts[-1]   # 0 = now, -30 = 30s ago
 
-        self._set_lines(xs, speeds, gears, throttles, brakes)
+        self._set_lines(xs, tb.view("speed"), tb.view("gear"),
+                        tb.view("throttle"), tb.view("brake"))
 
-        x_min = -_TIME_WINDOW
-        x_max = 0
-        for ax in (self._ax_speed, self._ax_gear, self._ax_ctrl):
-            ax.set_xlim(x_min, x_max)
+        self._set_xlim(-_TIME_WINDOW, 0)
 
     def _redraw_lap(self, code: str):
         lb = self._lap_buffers.get(code)
-        if not lb or not lb["samples"]:
+        if not lb:
             self._clear_lines()
             return
 
-        samples   = lb["samples"]
-        xs        = [s["dist"]     for s in samples]
-        speeds    = [s["speed"]    for s in samples]
-        gears     = [s["gear"]     for s in samples]
-        throttles = [s["throttle"] for s in samples]
-        brakes    = [s["brake"]    for s in samples]
+        xs = lb.view("dist")
 
-        self._set_lines(xs, speeds, gears, throttles, brakes)
+        self._set_lines(xs, lb.view("speed"), lb.view("gear"),
+                        lb.view("throttle"), lb.view("brake"))
 
         # X-axis: prefer the authoritative circuit length from the session.
         # Fall back to the most recently completed lap's distance, then the
@@ -261,45 +436,86 @@ class DriverTelemetryWindow(PitWallWindow):
         lap_length = (
             self._circuit_length_m
             or self._lap_lengths.get(code)
-            or max(xs)
+            or float(xs.max())
         )
-        for ax in (self._ax_speed, self._ax_gear, self._ax_ctrl):
-            ax.set_xlim(0, lap_length)
+        self._set_xlim(0, lap_length)
 
     def _set_lines(self, xs, speeds, gears, throttles, brakes):
         self._line_speed.set_data(xs, speeds)
         self._line_gear.set_data(xs, gears)
-        self._line_throt.set_data(xs, throttles)
-        self._line_brake.set_data(xs, brakes)
+        # Brake is buffered as 0-1 but charted as 0-100 %, scaled in one vector op
+        self._ctrl_lines.set_segments([
+            np.column_stack((xs, throttles)),
+            np.column_stack((xs, brakes * 100.0)),
+        ])
 
     def _clear_lines(self):
-        for line in (self._line_speed, self._line_gear, self._line_throt, self._line_brake):
+        for line in (self._line_speed, self._line_gear):
             line.set_data([], [])
-        self._canvas.draw_idle()
+        self._ctrl_lines.set_segments([])
+        self._update_canvas()
+
+    def _set_xlim(self, x_min: float, x_max: float):
+        if (x_min, x_max) == self._xlim:
+            return
+        self._xlim = (x_min, x_max)
+        for ax, _ in self._panels:
+            ax.set_xlim(x_min, x_max)
+        self._full_draw_pending = True
+
+    def _update_canvas(self):
+        # Limits or labels changed: the cached backgrounds are stale, so
+        # schedule a full draw (which re-captures them in _on_draw).
+        if self._full_draw_pending or self._backgrounds is None:
+            self._canvas.draw_idle()
+            return
+        # Render all panels into the Agg buffer, then push the changed region
+        # to the widget in one blit (one repaint) rather than one per axes.
+        for (ax, lines), background in zip(self._panels, self._backgrounds):
+            self._canvas.restore_region(background)
+            for line in lines:
+                ax.draw_artist(line)
+        self._canvas.blit(self._blit_bbox)
+
+    def _on_draw(self, event):
+        self._backgrounds = [self._canvas.copy_from_bbox(ax.bbox) for ax, _ in self._panels]
+        self._blit_bbox = Bbox.union([ax.bbox for ax, _ in self._panels])
+        for ax, lines in self._panels:
+            for line in lines:
+                ax.draw_artist(line)
+        self._full_draw_pending = False
 
     # ── PitWallWindow overrides ───────────────────────────────────────────
 
     def on_telemetry_data(self, data):
         if "frame" not in data or not data["frame"]:
             return
-        drivers = data["frame"].get("drivers", {})
-        if not drivers:
+        if not data["frame"].get("drivers"):
             return
 
         # Capture circuit length the first time it arrives
         if self._circuit_length_m is None and data.get("circuit_length_m"):
             self._circuit_length_m = float(data["circuit_length_m"])
 
-        session_t = float(data["frame"].get("t") or 0)
-
-        self._refresh_driver_list(drivers)
-
-        for code, driver in drivers.items():
-            self._append_sample(code, driver, session_t)
-
-        selected = self.driver_combo.currentText()
-        if selected:
-            self._redraw(selected)
+        # Ingested together with the next redraw tick. If the GUI falls that
+        # far behind, ingest now rather than let the backlog grow unbounded.
+        self._pending_frames.append(data["frame"])
+        if len(self._pending_frames) >= _MAX_PENDING_FRAMES:
+            self._ingest_pending()
+
+    def _ingest_pending(self):
+        pending = self._pending_frames
+        while pending:
+            frame = pending.popleft()
+            drivers = frame["drivers"]
+            self._refresh_driver_list(drivers)
+            self._track_lap_starts(drivers)
+
+            # Only the plotted driver needs samples buffered
+            selected = self._selected_code
+            driver = drivers.get(selected)
+            if driver:
+                self._append_sample(selected, driver, float(frame.get("t") or 0))
 
     def on_connection_status_changed(self, status):
         if status != "Connected":
@@ -307,8 +523,7 @@ class DriverTelemetryWindow(PitWallWindow):
 
 
 def main():
-    app = QApplication(sys.argv)
-    app.setApplicationName("Driver Live Telemetry")
+    app = get_or_create_qapp("Driver Live Telemetry")
     window = DriverTelemetryWindow()
     window.show()
     sys.exit(app.exec())
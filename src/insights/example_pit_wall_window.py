@@ -1,14 +1,94 @@
 import sys
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QLabel, 
-    QTextEdit, QGroupBox
+    QWidget, QVBoxLayout, QLabel, 
+    QTableView, QHeaderView, QGroupBox
 )
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont
 from src.gui.pit_wall_window import PitWallWindow
+from src.gui.qt_app import get_or_create_qapp
+
+# Shared fonts, built once instead of per widget
+_FONT_LABEL = QFont("Arial", 14)
+_FONT_MONO = QFont("Courier", 10)
+
+
+class DriverTableModel(QAbstractTableModel):
+    """
+    One row per driver (sorted by code) with lap, speed and distance.
+
+    Values are stored at display precision, so a frame only emits
+    dataChanged for the rows whose visible values actually moved.
+    """
+
+    HEADERS = ("Driver", "Lap", "Speed (km/h)", "Dist (m)")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._codes = []
+        # code -> (lap, speed, dist); None where the stream omitted a field
+        self._values = {}
+
+    def update_drivers(self, drivers_data):
+        """Apply one frame's `drivers` dict to the table."""
+        values = {
+            code: (
+                info.get('lap'),
+                round(info['speed']) if 'speed' in info else None,
+                round(info['dist']) if 'dist' in info else None,
+            )
+            for code, info in drivers_data.items()
+        }
+        
+        # The driver set rarely changes; rebuild the rows only when it does
+        if values.keys() != self._values.keys():
+            self.beginResetModel()
+            self._codes = sorted(values)
+            self._values = values
+            self.endResetModel()
+            return
+        
+        first = last = None
+        for row, code in enumerate(self._codes):
+            if values[code] != self._values[code]:
+                if first is None:
+                    first = row
+                last = row
+        self._values = values
+        if first is not None:
+            self.dataChanged.emit(
+                self.index(first, 1), self.index(last, len(self.HEADERS) - 1), [Qt.DisplayRole]
+            )
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._codes)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        code = self._codes[index.row()]
+        if index.column() == 0:
+            return code
+        value = self._values[code][index.column() - 1]
+        return None if value is None else str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
 
 
 class ExamplePitWallWindow(PitWallWindow):
     def __init__(self):
+        # Raw values behind each label's current text, so unchanged values
+        # skip both the string formatting and the setText call
+        self._prev_frame = None
+        self._prev_track_status = None
+        self._prev_playback = None
+        self._prev_driver_count = None
         super().__init__()
         self.setWindowTitle("F1 Race Replay - Example Pit Wall")
     
@@ -23,19 +103,19 @@ class ExamplePitWallWindow(PitWallWindow):
         session_layout = QVBoxLayout(session_group)
         
         self.frame_label = QLabel("Frame: -")
-        self.frame_label.setFont(QFont("Arial", 14))
+        self.frame_label.setFont(_FONT_LABEL)
         session_layout.addWidget(self.frame_label)
         
         self.drivers_label = QLabel("Active Drivers: -")
-        self.drivers_label.setFont(QFont("Arial", 14))
+        self.drivers_label.setFont(_FONT_LABEL)
         session_layout.addWidget(self.drivers_label)
         
         self.track_status_label = QLabel("Track Status: -")
-        self.track_status_label.setFont(QFont("Arial", 14))
+        self.track_status_label.setFont(_FONT_LABEL)
         session_layout.addWidget(self.track_status_label)
         
         self.playback_label = QLabel("Playback: -")
-        self.playback_label.setFont(QFont("Arial", 14))
+        self.playback_label.setFont(_FONT_LABEL)
         session_layout.addWidget(self.playback_label)
         
         layout.addWidget(session_group)
@@ -44,54 +124,55 @@ class ExamplePitWallWindow(PitWallWindow):
         drivers_group = QGroupBox("Driver Details")
         drivers_layout = QVBoxLayout(drivers_group)
         
-        self.drivers_text = QTextEdit()
-        self.drivers_text.setFont(QFont("Courier", 10))
-        self.drivers_text.setReadOnly(True)
-        drivers_layout.addWidget(self.drivers_text)
+        self.drivers_model = DriverTableModel(self)
+        self.drivers_table = QTableView()
+        self.drivers_table.setModel(self.drivers_model)
+        self.drivers_table.setFont(_FONT_MONO)
+        self.drivers_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.drivers_table.setSelectionMode(QTableView.NoSelection)
+        self.drivers_table.verticalHeader().setVisible(False)
+        self.drivers_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        drivers_layout.addWidget(self.drivers_table)
         
         layout.addWidget(drivers_group)
     
     def on_telemetry_data(self, data):
         # Update frame info
         if 'frame_index' in data:
-            frame_text = f"Frame: {data['frame_index']}"
-            if 'total_frames' in data:
-                frame_text += f" / {data['total_frames']}"
-            self.frame_label.setText(frame_text)
+            frame = (data['frame_index'], data.get('total_frames'))
+            if frame != self._prev_frame:
+                self._prev_frame = frame
+                frame_text = f"Frame: {data['frame_index']}"
+                if 'total_frames' in data:
+                    frame_text += f" / {data['total_frames']}"
+                self.frame_label.setText(frame_text)
         
         # Update track status
-        if 'track_status' in data:
+        if 'track_status' in data and data['track_status'] != self._prev_track_status:
+            self._prev_track_status = data['track_status']
             self.track_status_label.setText(f"Track Status: {data['track_status']}")
         
         # Update playback state
         if 'playback_speed' in data and 'is_paused' in data:
-            state = "PAUSED" if data['is_paused'] else "PLAYING"
-            self.playback_label.setText(f"Playback: {state} ({data['playback_speed']}x)")
+            playback = (data['is_paused'], data['playback_speed'])
+            if playback != self._prev_playback:
+                self._prev_playback = playback
+                state = "PAUSED" if data['is_paused'] else "PLAYING"
+                self.playback_label.setText(f"Playback: {state} ({data['playback_speed']}x)")
         
         # Update driver information
         if 'frame' in data and data['frame'] and 'drivers' in data['frame']:
             drivers_data = data['frame']['drivers']
-            self.drivers_label.setText(f"Active Drivers: {len(drivers_data)}")
-            
-            # Format driver details
-            driver_lines = []
-            for code, driver_info in sorted(drivers_data.items()):
-                line_parts = [f"{code}:"]
-                
-                if 'lap' in driver_info:
-                    line_parts.append(f"Lap {driver_info['lap']}")
-                
-                if 'speed' in driver_info:
-                    line_parts.append(f"{driver_info['speed']:.0f} km/h")
-                
-                if 'dist' in driver_info:
-                    line_parts.append(f"{driver_info['dist']:.0f}m")
-                
-                driver_lines.append("  ".join(line_parts))
+            if len(drivers_data) != self._prev_driver_count:
+                self._prev_driver_count = len(drivers_data)
+                self.drivers_label.setText(f"Active Drivers: {len(drivers_data)}")
             
-            self.drivers_text.setText('\n'.join(driver_lines))
+            # Only rows whose displayed values changed are repainted
+            self.drivers_model.update_drivers(drivers_data)
     
     def on_connection_status_changed(self, status):
+        # The frame label is overwritten below, so force the next frame to refresh it
+        self._prev_frame = None
         if status == "Connected":
             self.frame_label.setText("Frame: Waiting for data...")
         elif status == "Disconnected":
@@ -104,8 +185,7 @@ class ExamplePitWallWindow(PitWallWindow):
 
 
 def main():
-    app = QApplication(sys.argv)
-    app.setApplicationName("Example Pit Wall")
+    app = get_or_create_qapp("Example Pit Wall")
     
     window = ExamplePitWallWindow()
     window.show()
@@ -1,18 +1,116 @@
 import sys
 import json
-from datetime import datetime
+import time
+from collections import deque
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QVBoxLayout, QWidget, 
-    QTextEdit, QLabel, QStatusBar, QSplitter, QListWidget,
+    QMainWindow, QVBoxLayout, QWidget, 
+    QPlainTextEdit, QLabel, QStatusBar, QSplitter, QListWidget,
     QTabWidget
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QTextCursor
+from PySide6.QtCore import Qt, QEvent, QObject, QThread, QTimer, Signal, Slot
+from PySide6.QtGui import QFont
 from src.services.stream import TelemetryStreamClient
+from src.gui.qt_app import get_or_create_qapp
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the (much slower) stdlib encoder
+    orjson = None
+
+_FONT_MONO = QFont("Courier", 10)
+_FONT_MONO_LARGE = QFont("Courier", 11)
+
+# Raw log limits: lines kept in the pane (older lines are dropped), entries
+# buffered between flushes, and the flush cadence
+_RAW_LOG_MAX_LINES = 10000
+_RAW_LOG_MAX_PENDING = 200
+_RAW_LOG_FLUSH_MS = 100
+
+# Recent messages list: lines kept and refresh cadence
+_RECENT_MESSAGES_MAX = 20
+_RECENT_FLUSH_MS = 200
+
+def _playback_state(is_paused):
+    return 'PAUSED' if is_paused else 'PLAYING'
+
+# Optional message fields in display order, as (message key, value transform
+# or None, summary pane line, recent messages suffix)
+_SUMMARY_FIELDS = (
+    ('total_frames', None, "Total Frames: {}", ""),
+    ('track_status', None, "Track Status: {}", " | Status: {}"),
+    ('playback_speed', None, "Playback Speed: {}x", " | Speed: {}x"),
+    ('is_paused', _playback_state, "Playback State: {}", " | {}"),
+)
+
+# Cadence of drivers pane re-renders; frames in between only update the cached frame
+_DRIVERS_FLUSH_MS = 100
+
+# Newest messages kept while the window is hidden or minimized, replayed on restore
+_HIDDEN_BACKLOG_MAX = 200
+
+# Track status events kept (newest first)
+_EVENTS_MAX = 100
+
+# Upper bound on lines in the summary / drivers panes (one line per field or driver)
+_PANE_MAX_LINES = 50
+
+def _format_json(data):
+    """Pretty-print a message for the raw log, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+class _RawLogFormatter(QObject):
+    # Lives on a worker thread: buffers raw log entries as they arrive, formats them on each tick and hands the joined text back to the viewer in one batch.
+    
+    batch_ready = Signal(str)
+    
+    def __init__(self):
+        super().__init__()
+        # If more entries arrive between flushes than are kept, the oldest are
+        # dropped before they cost any formatting
+        self._pending = deque(maxlen=_RAW_LOG_MAX_PENDING)
+        self._timer = None
+        
+    @Slot()
+    def start(self):
+        """Start the flush timer; called on the worker thread so the timer fires there."""
+        self._timer = QTimer(self)
+        self._timer.setInterval(_RAW_LOG_FLUSH_MS)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+        
+    @Slot()
+    def stop(self):
+        """Stop the flush timer from the worker thread as it exits."""
+        if self._timer is not None:
+            self._timer.stop()
+        
+    @Slot(str, object)
+    def enqueue(self, header, data):
+        """Buffer an entry: a header line plus the message to pretty-print, or None."""
+        self._pending.append((header, data))
+        
+    @Slot()
+    def flush(self):
+        """Format all buffered entries and emit them as a single block of text."""
+        if not self._pending:
+            return
+        entries = []
+        while self._pending:
+            header, data = self._pending.popleft()
+            if data is None:
+                entries.append(header)
+            else:
+                entries.append(f"{header}\n{_format_json(data)}\n{'='*50}\n")
+        self.batch_ready.emit('\n'.join(entries))
 
 class TelemetryStreamViewer(QMainWindow):
     # This window is used to demonstrate the telemetry stream data being sent from the replay process. It connects to the telemetry stream server, receives real-time telemetry data, and displays it in a simple UI for debugging and demonstration purposes.
     
+    # Hands a raw log entry (header, message or None) to the formatter thread
+    raw_log_entry = Signal(str, object)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("F1 Race Replay - Telemetry Stream Viewer")
@@ -28,6 +126,33 @@ class TelemetryStreamViewer(QMainWindow):
         self.message_count = 0
         self.last_frame_index = -1
         self.drivers_seen = set()
+        self._last_track_status = None
+        
+        # Events are kept here so the events tab can be filled when first shown
+        self._events = deque(maxlen=_EVENTS_MAX)
+        
+        # Drivers and events tabs are built on first visit; until then these are None
+        self.drivers_text = None
+        self.events_list = None
+        self._lazy_tabs = {}
+        
+        # Wall-clock "HH:MM:SS" for the current second; strftime runs once per second
+        self._clock_second = None
+        self._clock_text = ""
+        
+        # Newest summary lines first; copied into the list widget on the next tick
+        self._recent_messages = deque(maxlen=_RECENT_MESSAGES_MAX)
+        self._recent_dirty = False
+        
+        # (message number, arrival time, message) received while nothing is on screen
+        self._hidden_backlog = deque(maxlen=_HIDDEN_BACKLOG_MAX)
+        
+        # Newest frame for the drivers pane; rendered on the next timer tick
+        self._latest_frame = None
+        self._drivers_dirty = False
+        
+        # Text last written to the drivers pane, to skip identical rewrites
+        self._drivers_shown = None
         
         # Setup UI
         self.setup_ui()
@@ -53,10 +178,23 @@ class TelemetryStreamViewer(QMainWindow):
         left_layout = QVBoxLayout(left_widget)
         
         left_layout.addWidget(QLabel("Raw Telemetry Stream:"))
-        self.raw_log = QTextEdit()
-        self.raw_log.setFont(QFont("Courier", 10))
+        self.raw_log = QPlainTextEdit()
+        self.raw_log.setFont(_FONT_MONO)
+        self.raw_log.setReadOnly(True)
+        self.raw_log.setMaximumBlockCount(_RAW_LOG_MAX_LINES)
         left_layout.addWidget(self.raw_log)
         
+        # Raw log entries are formatted on a worker thread and come back in
+        # one batch per tick
+        self._raw_log_thread = QThread(self)
+        self._raw_log_formatter = _RawLogFormatter()
+        self._raw_log_formatter.moveToThread(self._raw_log_thread)
+        self._raw_log_thread.started.connect(self._raw_log_formatter.start)
+        self._raw_log_thread.finished.connect(self._raw_log_formatter.stop, Qt.DirectConnection)
+        self.raw_log_entry.connect(self._raw_log_formatter.enqueue, Qt.QueuedConnection)
+        self._raw_log_formatter.batch_ready.connect(self.append_raw_log, Qt.QueuedConnection)
+        self._raw_log_thread.start()
+        
         # Right panel - Parsed data
         right_widget = QWidget()
         right_layout = QVBoxLayout(right_widget)
@@ -66,8 +204,11 @@ class TelemetryStreamViewer(QMainWindow):
         right_layout.addWidget(self.tab_widget)
         
         self.setup_summary_tab()
-        self.setup_drivers_tab()
-        self.setup_events_tab()
+        # The other tabs start as empty pages and are filled on first visit
+        for title, builder in (("Drivers", self.setup_drivers_tab), ("Events", self.setup_events_tab)):
+            page = QWidget()
+            self._lazy_tabs[self.tab_widget.addTab(page, title)] = (builder, page)
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         # Add widgets to splitter
         splitter.addWidget(left_widget)
@@ -79,8 +220,7 @@ class TelemetryStreamViewer(QMainWindow):
         summary_widget = QWidget()
         layout = QVBoxLayout(summary_widget)
         
-        self.summary_text = QTextEdit()
-        self.summary_text.setFont(QFont("Courier", 11))
+        self.summary_text = self._create_text_pane(_FONT_MONO_LARGE)
         self.summary_text.setMaximumHeight(200)
         layout.addWidget(QLabel("Session Summary:"))
         layout.addWidget(self.summary_text)
@@ -92,28 +232,54 @@ class TelemetryStreamViewer(QMainWindow):
         
         self.tab_widget.addTab(summary_widget, "Summary")
         
-    def setup_drivers_tab(self):
-        """Create drivers tab showing driver positions and data."""
-        drivers_widget = QWidget()
+        # Refresh the recent messages list in bulk at a fixed cadence
+        self._recent_timer = QTimer(self)
+        self._recent_timer.setInterval(_RECENT_FLUSH_MS)
+        self._recent_timer.timeout.connect(self.flush_recent_messages)
+        self._recent_timer.start()
+        
+    @Slot(int)
+    def _on_tab_changed(self, index):
+        """Build a lazily created tab the first time it becomes current."""
+        lazy_tab = self._lazy_tabs.pop(index, None)
+        if lazy_tab is not None:
+            builder, page = lazy_tab
+            builder(page)
+        
+    def setup_drivers_tab(self, drivers_widget):
+        """Fill the drivers tab showing driver positions and data."""
         layout = QVBoxLayout(drivers_widget)
         
         layout.addWidget(QLabel("Driver Positions & Data:"))
-        self.drivers_text = QTextEdit()
-        self.drivers_text.setFont(QFont("Courier", 10))
+        self.drivers_text = self._create_text_pane(_FONT_MONO)
         layout.addWidget(self.drivers_text)
         
-        self.tab_widget.addTab(drivers_widget, "Drivers")
+        # Render whatever frame arrived before the tab existed
+        self._drivers_dirty = self._latest_frame is not None
+        
+        # Re-render the drivers pane at a fixed cadence from the latest frame
+        self._drivers_timer = QTimer(self)
+        self._drivers_timer.setInterval(_DRIVERS_FLUSH_MS)
+        self._drivers_timer.timeout.connect(self.flush_drivers_view)
+        self._drivers_timer.start()
         
-    def setup_events_tab(self):
-        """Create events tab showing track status and race events."""
-        events_widget = QWidget()
+    def setup_events_tab(self, events_widget):
+        """Fill the events tab showing track status and race events."""
         layout = QVBoxLayout(events_widget)
         
         layout.addWidget(QLabel("Track Status & Race Events:"))
         self.events_list = QListWidget()
+        self.events_list.addItems(self._events)
         layout.addWidget(self.events_list)
         
-        self.tab_widget.addTab(events_widget, "Events")
+    def _create_text_pane(self, font):
+        """Read-only plain-text pane for content that is replaced wholesale each update."""
+        pane = QPlainTextEdit()
+        pane.setFont(font)
+        pane.setReadOnly(True)
+        pane.setUndoRedoEnabled(False)
+        pane.setMaximumBlockCount(_PANE_MAX_LINES)
+        return pane
         
     def setup_status_bar(self):
         """Create status bar."""
@@ -128,115 +294,215 @@ class TelemetryStreamViewer(QMainWindow):
         self.status_bar.addPermanentWidget(self.messages_label)
         self.status_bar.addPermanentWidget(self.frame_label)
         
+    @Slot(dict)
     def on_data_received(self, data):
         """Handle incoming telemetry data."""
         self.message_count += 1
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        now = time.time()
+        
+        # Update events view; status changes are rare and must not be lost, so
+        # they are recorded even while the window is hidden
+        self.update_events_view(data, self._format_clock(now))
         
-        # Update raw log
-        json_str = json.dumps(data, indent=2)
-        log_entry = f"[{timestamp}] Message #{self.message_count}\n{json_str}\n{'='*50}\n"
-        self.raw_log.append(log_entry)
+        # Nothing is on screen: keep the newest messages and catch up on restore
+        if not self.isVisible() or self.isMinimized():
+            self._hidden_backlog.append((self.message_count, now, data))
+            return
+        self._show_message(self.message_count, now, data)
+        
+    def _show_message(self, message_number, now, data):
+        """Log one message and bring every view up to date with it."""
+        present = self._summary_values(data)
+        self._log_message(message_number, now, data, present)
+        self._update_views(data, present)
+        
+    def _log_message(self, message_number, now, data, present):
+        """Record one message in the per-message views: raw log, recent messages, drivers seen."""
+        timestamp = f"{self._format_clock(now)}.{int(now % 1 * 1000):03d}"
+        
+        # Update raw log (formatted off the UI thread)
+        self.raw_log_entry.emit(f"[{timestamp}] Message #{message_number}", data)
         
-        # Auto-scroll to bottom
-        cursor = self.raw_log.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.raw_log.setTextCursor(cursor)
+        # Add to recent messages list
+        self.add_recent_message(data, present)
+        
+        frame = data.get('frame')
+        if frame and 'drivers' in frame:
+            self.drivers_seen.update(frame['drivers'])
+            
+    def _update_views(self, data, present):
+        """Show a message's state in the summary, drivers view and status bar."""
+        # Before the summary, so "Current Frame" matches this message
+        frame_index = data.get('frame_index')
+        if frame_index is not None:
+            self.last_frame_index = frame_index
             
         # Update summary
-        self.update_summary(data)
+        self.update_summary(present)
         
         # Update drivers view
         self.update_drivers_view(data)
         
-        # Update events view
-        self.update_events_view(data)
-        
         # Update status bar
         self.messages_label.setText(f"Messages: {self.message_count}")
-        if 'frame_index' in data:
-            self.frame_label.setText(f"Frame: {data['frame_index']}")
-            self.last_frame_index = data['frame_index']
+        if frame_index is not None:
+            self.frame_label.setText(f"Frame: {frame_index}")
             
-    def update_summary(self, data):
-        """Update the summary tab with session information."""
-        # Add to recent messages list
-        summary_line = f"Frame {data.get('frame_index', '?')}: "
-        if 'frame' in data and data['frame']:
-            summary_line += f"Time {data['frame'].get('t', '?')}s"
-        if 'track_status' in data:
-            summary_line += f" | Status: {data['track_status']}"
-        if 'playback_speed' in data:
-            summary_line += f" | Speed: {data['playback_speed']}x"
-        if 'is_paused' in data:
-            summary_line += f" | {'PAUSED' if data['is_paused'] else 'PLAYING'}"
+    def _replay_hidden_backlog(self):
+        """Catch up on messages that arrived while the window was hidden, in one pass.
+        
+        Every message is logged, but the state views only show the newest one.
+        """
+        if not self._hidden_backlog:
+            return
+        for message_number, now, data in self._hidden_backlog:
+            present = self._summary_values(data)
+            self._log_message(message_number, now, data, present)
+        self._update_views(data, present)
+        self._hidden_backlog.clear()
             
-        self.recent_messages.insertItem(0, summary_line)
-        if self.recent_messages.count() > 20:
-            self.recent_messages.takeItem(self.recent_messages.count() - 1)
+    def showEvent(self, event):
+        """Catch up on messages received before the window was shown."""
+        super().showEvent(event)
+        self._replay_hidden_backlog()
+        
+    def changeEvent(self, event):
+        """Catch up on messages received while the window was minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self._replay_hidden_backlog()
             
-        # Update summary text
-        summary_info = []
-        summary_info.append(f"Total Messages Received: {self.message_count}")
-        summary_info.append(f"Current Frame: {self.last_frame_index}")
-        summary_info.append(f"Drivers Seen: {len(self.drivers_seen)}")
-        
-        if 'total_frames' in data:
-            summary_info.append(f"Total Frames: {data['total_frames']}")
-        if 'track_status' in data:
-            summary_info.append(f"Track Status: {data['track_status']}")
-        if 'playback_speed' in data:
-            summary_info.append(f"Playback Speed: {data['playback_speed']}x")
-        if 'is_paused' in data:
-            summary_info.append(f"Playback State: {'PAUSED' if data['is_paused'] else 'PLAYING'}")
+    def _format_clock(self, now):
+        """Return the local "HH:MM:SS" for a time.time() value."""
+        second = int(now)
+        if second != self._clock_second:
+            self._clock_second = second
+            self._clock_text = time.strftime("%H:%M:%S", time.localtime(second))
+        return self._clock_text
+        
+    @Slot(str)
+    def append_raw_log(self, text):
+        """Append a batch of formatted raw log entries in a single edit."""
+        scroll_bar = self.raw_log.verticalScrollBar()
+        value = scroll_bar.value()
+        if value == scroll_bar.maximum():
+            # appendPlainText keeps the view pinned to the bottom if it already was
+            self.raw_log.appendPlainText(text)
+            return
+        
+        # Scrolled up: leave the view alone, but shift it by the lines trimmed
+        # from the top so the same entries stay on screen
+        block_count = self.raw_log.blockCount()
+        self.raw_log.appendPlainText(text)
+        trimmed = block_count + text.count('\n') + 1 - self.raw_log.blockCount()
+        if trimmed > 0:
+            scroll_bar.setValue(max(0, value - trimmed))
+        
+    def _summary_values(self, data):
+        """Return the optional fields present in a message as (summary template, line template, value)."""
+        # Look each field up once; both the recent messages line and the
+        # summary are built from the ones present
+        present = []
+        for key, transform, summary_template, line_template in _SUMMARY_FIELDS:
+            value = data.get(key)
+            if value is not None:
+                present.append((summary_template, line_template, transform(value) if transform else value))
+        return present
+        
+    def add_recent_message(self, data, present):
+        """Add a one-line summary of a message to the recent messages list."""
+        frame = data.get('frame')
+        summary_line = ''.join([
+            f"Frame {data.get('frame_index', '?')}: ",
+            f"Time {frame.get('t', '?')}s" if frame else "",
+            *(line_template.format(value) for _, line_template, value in present),
+        ])
+        self._recent_messages.appendleft(summary_line)
+        self._recent_dirty = True
             
-        self.summary_text.setText('\n'.join(summary_info))
+    def update_summary(self, present):
+        """Update the summary tab with session information."""
+        summary_info = [
+            f"Total Messages Received: {self.message_count}",
+            f"Current Frame: {self.last_frame_index}",
+            f"Drivers Seen: {len(self.drivers_seen)}",
+            *(summary_template.format(value) for summary_template, _, value in present),
+        ]
+        self.summary_text.setPlainText('\n'.join(summary_info))
+        
+    @Slot()
+    def flush_recent_messages(self):
+        """Replace the recent messages list with the buffered lines, if any arrived."""
+        if not self._recent_dirty:
+            return
+        self._recent_dirty = False
+        self.recent_messages.clear()
+        self.recent_messages.addItems(self._recent_messages)
         
     def update_drivers_view(self, data):
-        """Update the drivers tab with current driver data."""
-        if 'frame' not in data or not data['frame'] or 'drivers' not in data['frame']:
+        """Record the latest driver data; the drivers tab is redrawn on the next tick."""
+        frame = data.get('frame')
+        if not frame or 'drivers' not in frame:
             return
             
-        drivers_data = data['frame']['drivers']
+        self._latest_frame = frame
+        self._drivers_dirty = True
+            
+    @Slot()
+    def flush_drivers_view(self):
+        """Render the newest recorded frame into the drivers tab, if it changed."""
+        if not self._drivers_dirty or self.drivers_text is None:
+            return
+        self._drivers_dirty = False
+        
+        drivers_data = self._latest_frame['drivers']
         drivers_info = []
         
         for code, driver_data in drivers_data.items():
-            self.drivers_seen.add(code)
-            
-            line = f"{code}: "
-            if 'x' in driver_data and 'y' in driver_data:
-                line += f"Pos({driver_data['x']:.1f}, {driver_data['y']:.1f}) "
-            if 'speed' in driver_data:
-                line += f"Speed({driver_data['speed']:.1f}km/h) "
-            if 'lap' in driver_data:
-                line += f"Lap({driver_data['lap']}) "
-            if 'dist' in driver_data:
-                line += f"Dist({driver_data['dist']:.1f}m)"
+            # Collect the fields present and join once rather than growing a string
+            get = driver_data.get
+            x, y, speed, lap, dist = get('x'), get('y'), get('speed'), get('lap'), get('dist')
+            parts = [f"{code}:"]
+            if x is not None and y is not None:
+                parts.append(f"Pos({x:.1f}, {y:.1f})")
+            if speed is not None:
+                parts.append(f"Speed({speed:.1f}km/h)")
+            if lap is not None:
+                parts.append(f"Lap({lap})")
+            if dist is not None:
+                parts.append(f"Dist({dist:.1f}m)")
                 
-            drivers_info.append(line)
+            drivers_info.append(' '.join(parts))
             
-        self.drivers_text.setText('\n'.join(sorted(drivers_info)))
-        
-    def update_events_view(self, data):
+        drivers = '\n'.join(sorted(drivers_info))
+        if drivers == self._drivers_shown:
+            return  # e.g. paused: positions have not moved since the last render
+        self._drivers_shown = drivers
+        # Straight to the document: skips the editor-level bookkeeping of setPlainText
+        self.drivers_text.document().setPlainText(drivers)
+        
+    def update_events_view(self, data, timestamp):
         """Update the events tab with track status changes."""
-        if 'track_status' in data:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            event_text = f"[{timestamp}] Track Status: {data['track_status']}"
-            if 'frame_index' in data:
-                event_text += f" (Frame {data['frame_index']})"
-            
-            # Only add if it's a change or first message
-            if self.events_list.count() == 0:
-                self.events_list.insertItem(0, event_text)
-            else:
-                last_item = self.events_list.item(0)
-                if last_item and data['track_status'] not in last_item.text():
-                    self.events_list.insertItem(0, event_text)
-                    
-            # Keep only recent events
-            while self.events_list.count() > 100:
-                self.events_list.takeItem(self.events_list.count() - 1)
+        # Only the first status and actual changes reach the list widget
+        track_status = data.get('track_status')
+        if track_status is None or track_status == self._last_track_status:
+            return
+        self._last_track_status = track_status
+        
+        event_text = f"[{timestamp}] Track Status: {track_status}"
+        if 'frame_index' in data:
+            event_text += f" (Frame {data['frame_index']})"
+        self._events.appendleft(event_text)
+        
+        if self.events_list is None:
+            return
+        self.events_list.insertItem(0, event_text)
+        
+        # Keep only recent events
+        if self.events_list.count() > _EVENTS_MAX:
+            self.events_list.takeItem(_EVENTS_MAX)
                 
+    @Slot(str)
     def on_connection_status(self, status):
         """Handle connection status updates."""
         self.connection_label.setText(f"Status: {status}")
@@ -247,11 +513,12 @@ class TelemetryStreamViewer(QMainWindow):
         else:
             self.connection_label.setStyleSheet("color: red; font-weight: bold;")
             
+    @Slot(str)
     def on_error(self, error_msg):
         """Handle error messages."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self._format_clock(time.time())
         error_entry = f"[{timestamp}] ERROR: {error_msg}\n"
-        self.raw_log.append(error_entry)
+        self.raw_log_entry.emit(error_entry, None)
         self.status_bar.showMessage(f"Error: {error_msg}", 5000)
         
     def closeEvent(self, event):
@@ -261,6 +528,8 @@ class TelemetryStreamViewer(QMainWindow):
                 self.client.stop()
                 if not self.client.wait(2000):  # Wait max 2 seconds
                     print("Warning: Telemetry client did not stop in time")
+            self._raw_log_thread.quit()
+            self._raw_log_thread.wait(2000)
         except Exception as e:
             print(f"Error during telemetry cleanup: {e}")
         finally:
@@ -268,8 +537,7 @@ class TelemetryStreamViewer(QMainWindow):
 
 
 def main():
-    app = QApplication(sys.argv)
-    app.setApplicationName("Telemetry Stream Viewer")
+    app = get_or_create_qapp("Telemetry Stream Viewer")
     
     # Create and show main window
     viewer = TelemetryStreamViewer()
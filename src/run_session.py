@@ -2,10 +2,13 @@ import os
 import subprocess
 import sys
 import threading
-import time
 import arcade
 from src.interfaces.race_replay import F1RaceReplayWindow
-from src.insights.telemetry_stream_viewer import main as telemetry_viewer_main
+
+# Set once the replay window (and with it the telemetry stream server) exists.
+# Launchers wait on this instead of sleeping for a fixed time; after the timeout they go ahead anyway, since stream clients retry their connection.
+_replay_ready = threading.Event()
+_REPLAY_READY_TIMEOUT_S = 30
 
 def run_arcade_replay(frames, track_statuses, example_lap, drivers, title,
                       playback_speed=1.0, driver_colors=None, circuit_rotation=0.0, total_laps=None,
@@ -25,6 +28,7 @@ def run_arcade_replay(frames, track_statuses, example_lap, drivers, title,
         session=session,
         enable_telemetry=enable_telemetry
     )
+    _replay_ready.set()
     # Signal readiness to parent process (if requested) after window created
     if ready_file:
         try:
@@ -37,11 +41,12 @@ def run_arcade_replay(frames, track_statuses, example_lap, drivers, title,
 
 def launch_telemetry_viewer():
   # Launch the telemetry stream viewer in a separate process.
+  # Popen returns as soon as the child starts, so nothing blocks waiting for the viewer to exit.
   def start_viewer():
     try:
-      # Give the main application a moment to start the telemetry server
-      time.sleep(3)
-      subprocess.run([sys.executable, "-m", "src.insights.telemetry_stream_viewer"], check=False)
+      # Wait for the main application to start the telemetry server
+      _replay_ready.wait(_REPLAY_READY_TIMEOUT_S)
+      subprocess.Popen([sys.executable, "-m", "src.insights.telemetry_stream_viewer"])
     except Exception as e:
       print(f"Failed to launch telemetry viewer: {e}")
   
@@ -52,8 +57,8 @@ def launch_telemetry_viewer():
 def launch_insights_menu():
   def start_menu():
     try:
-      # Give the main application a moment to start
-      time.sleep(1)
+      # Wait for the main application to start
+      _replay_ready.wait(_REPLAY_READY_TIMEOUT_S)
       subprocess.run([sys.executable, "-m", "src.gui.insights_menu"], check=False)
     except Exception as e:
       print(f"Failed to launch insights menu: {e}")
@@ -8,6 +8,9 @@ import threading
 import time
 from PySide6.QtCore import QThread, Signal
 
+# Bytes requested per recv(); a full-grid frame is several KB of JSON
+_RECV_SIZE = 65536
+
 class TelemetryStreamServer:
 
   # This class is going to be hosted by the race_replay window process, which is the primary consumer of telemetry data. It will broadcast the telemetry frames
@@ -140,28 +143,38 @@ class TelemetryStreamClient(QThread):
           
   def _receive_data(self):
     # Receive and parse incoming telemetry data.
-    buffer = ""
+    # Raw bytes are buffered and each complete line is handed to json.loads
+    # as-is, so a frame is scanned once and never re-copied while it arrives
+    buffer = bytearray()
     
     while self.running and self.connected:
       try:
         # Receive data in chunks
-        chunk = self.socket.recv(4096).decode('utf-8')
+        chunk = self.socket.recv(_RECV_SIZE)
         if not chunk:
           # Server closed connection
           self.connected = False
           break
-            
+        
+        # Only the newly received bytes can hold the next delimiter
+        search_from = len(buffer)
         buffer += chunk
         
         # Process complete messages (separated by newlines)
-        while '\n' in buffer:
-          line, buffer = buffer.split('\n', 1)
+        start = 0
+        end = buffer.find(b'\n', search_from)
+        while end != -1:
+          line = buffer[start:end]
           if line.strip():
             try:
-              data = json.loads(line.strip())
+              data = json.loads(line)
               self.data_received.emit(data)
-            except json.JSONDecodeError as e:
+            except ValueError as e:  # JSONDecodeError or invalid UTF-8
               self.error_occurred.emit(f"JSON decode error: {str(e)}")
+          start = end + 1
+          end = buffer.find(b'\n', start)
+        if start:
+          del buffer[:start]
                       
       except socket.timeout:
         continue  # Keep trying